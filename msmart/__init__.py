@@ -1,6 +1,10 @@
-from importlib import metadata
-
 try:
-    __version__ = metadata.version("msmart-ng")
-except metadata.PackageNotFoundError:
-    __version__ = "UNKNOWN"
+    # Version file generated by setuptools-scm at build time
+    from msmart._version import __version__
+except ImportError:
+    from importlib import metadata
+
+    try:
+        __version__ = metadata.version("msmart-ng")
+    except metadata.PackageNotFoundError:
+        __version__ = "UNKNOWN"
@@ -29,8 +29,9 @@ class Device():
         """Send a command to the device and return any responses."""
 
         data = command.tobytes()
-        _LOGGER.debug("Sending command to %s:%d: %s",
-                      self.ip, self.port, data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending command to %s:%d: %s",
+                          self.ip, self.port, data.hex())
 
         start = time.time()
         responses = None
@@ -35,7 +35,9 @@ _CRC8_854_TABLE = [
 
 
 def calculate(data: bytes) -> int:
+    # Bind table locally to avoid a global lookup per byte
+    table = _CRC8_854_TABLE
     crc_value = 0
     for m in data:
-        crc_value = _CRC8_854_TABLE[(crc_value ^ m) & 0xFF]
+        crc_value = table[crc_value ^ m]
     return crc_value
@@ -13,6 +13,12 @@ from msmart.frame import Frame
 
 _LOGGER = logging.getLogger(__name__)
 
+# Capability header of 16 bit ID and 8 bit size
+_CAPABILITY_HEADER = struct.Struct("<HB")
+
+# 16 bit property ID
+_PROPERTY_ID = struct.Struct("<H")
+
 
 class InvalidResponseException(Exception):
     pass
@@ -99,10 +105,13 @@ class Command(Frame):
     def tobytes(self, data: Union[bytes, bytearray] = bytes()) -> bytes:
         # Append message ID to payload
         # TODO Message ID in reference is just a random value
-        payload = data + bytes([self._next_message_id()])
+        payload = bytearray(data)
+        payload.append(self._next_message_id())
 
         # Append CRC
-        return super().tobytes(payload + bytes([crc8.calculate(payload)]))
+        payload.append(crc8.calculate(payload))
+
+        return super().tobytes(payload)
 
     def _next_message_id(self) -> int:
         Command._message_id += 1
@@ -112,6 +121,12 @@ class Command(Frame):
 class GetCapabilitiesCommand(Command):
     """Command to query capabilities of the device."""
 
+    # Get capabilities
+    _PAYLOAD = bytes([0xB5, 0x01, 0x00])
+
+    # Get more capabilities
+    _ADDITIONAL_PAYLOAD = bytes([0xB5, 0x01, 0x01, 0x1])
+
     def __init__(self, additional: bool = False) -> None:
         super().__init__(frame_type=FrameType.QUERY)
 
@@ -119,11 +134,9 @@ class GetCapabilitiesCommand(Command):
 
     def tobytes(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride] # nopep8
         if not self._additional:
-            # Get capabilities
-            payload = bytes([0xB5, 0x01, 0x00])
+            payload = self._PAYLOAD
         else:
-            # Get more capabilities
-            payload = bytes([0xB5, 0x01, 0x01, 0x1])
+            payload = self._ADDITIONAL_PAYLOAD
         return super().tobytes(payload)
 
 
@@ -290,7 +303,7 @@ class GetPropertiesCommand(Command):
         ])
 
         for prop in self._properties:
-            payload += struct.pack("<H", prop)
+            payload += _PROPERTY_ID.pack(prop)
 
         return super().tobytes(payload)
 
@@ -310,7 +323,7 @@ class SetPropertiesCommand(Command):
         ])
 
         for prop, value in self._properties.items():
-            payload += struct.pack("<H", prop)
+            payload += _PROPERTY_ID.pack(prop)
 
             if isinstance(value, int):
                 value = bytes([value])
@@ -324,6 +337,8 @@ class SetPropertiesCommand(Command):
 class Response():
     """Base class for AC responses."""
 
+    __slots__ = ("_id", "_payload")
+
     def __init__(self, payload: memoryview) -> None:
         # Set ID and copy the payload
         self._id = payload[0]
@@ -360,14 +375,10 @@ class Response():
             # Fetch the appropriate response class from the ID
             frame_type = frame_mv[9]
             response_id = frame_mv[10]
-            if response_id == ResponseId.STATE:
-                response_class = StateResponse
-            elif response_id == ResponseId.CAPABILITIES and frame_type == FrameType.QUERY:
-                # Some devices have unsolicited "capabilities" responses with a frame type of 0x5
-                response_class = CapabilitiesResponse
-            elif response_id in [ResponseId.PROPERTIES, ResponseId.PROPERTIES_ACK]:
-                response_class = PropertiesResponse
-            else:
+            response_class = _RESPONSE_CLASSES.get(response_id, Response)
+
+            # Some devices have unsolicited "capabilities" responses with a frame type of 0x5
+            if response_class == CapabilitiesResponse and frame_type != FrameType.QUERY:
                 response_class = Response
 
             # Validate the payload CRC
@@ -382,13 +393,16 @@ class Response():
 class CapabilitiesResponse(Response):
     """Response to capabilities query."""
 
+    __slots__ = ("_capabilities", "_additional_capabilities")
+
     def __init__(self, payload: memoryview) -> None:
         super().__init__(payload)
 
         self._capabilities = {}
         self._additional_capabilities = False
 
-        _LOGGER.debug("Capabilities response payload: %s", payload.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Capabilities response payload: %s", payload.hex())
 
         self._parse_capabilities(payload)
 
@@ -473,15 +487,14 @@ class CapabilitiesResponse(Response):
             if len(caps) < 3:
                 break
 
+            # Unpack 16 bit ID and size
+            raw_id, size = _CAPABILITY_HEADER.unpack_from(caps)
+
             # Skip empty capabilities
-            size = caps[2]
             if size == 0:
                 caps = caps[3:]
                 continue
 
-            # Unpack 16 bit ID
-            (raw_id, ) = struct.unpack("<H", caps[0:2])
-
             # Covert ID to enumerate type
             try:
                 capability_id = CapabilityId(raw_id)
@@ -656,6 +669,25 @@ class CapabilitiesResponse(Response):
 class StateResponse(Response):
     """Response to state query."""
 
+    __slots__ = (
+        "power_on",
+        "target_temperature",
+        "operational_mode",
+        "fan_speed",
+        "swing_mode",
+        "turbo_mode",
+        "eco_mode",
+        "sleep_mode",
+        "fahrenheit",
+        "indoor_temperature",
+        "outdoor_temperature",
+        "filter_alert",
+        "display_on",
+        "freeze_protection_mode",
+        "follow_me",
+        "purifier",
+    )
+
     def __init__(self, payload: memoryview) -> None:
         super().__init__(payload)
 
@@ -676,7 +708,8 @@ class StateResponse(Response):
         self.follow_me = None
         self.purifier = None
 
-        _LOGGER.debug("State response payload: %s", payload.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("State response payload: %s", payload.hex())
 
         self._parse(payload)
 
@@ -776,12 +809,15 @@ class StateResponse(Response):
 class PropertiesResponse(Response):
     """Response to properties query."""
 
+    __slots__ = ("_properties",)
+
     def __init__(self, payload: memoryview) -> None:
         super().__init__(payload)
 
         self._properties = {}
 
-        _LOGGER.debug("Properties response payload: %s", payload.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Properties response payload: %s", payload.hex())
 
         self._parse(payload)
 
@@ -820,7 +856,7 @@ class PropertiesResponse(Response):
                 continue
 
             # Unpack 16 bit ID
-            (raw_id, ) = struct.unpack("<H", props[0:2])
+            (raw_id, ) = _PROPERTY_ID.unpack_from(props)
 
             # Covert ID to enumerate type
             try:
@@ -850,3 +886,12 @@ class PropertiesResponse(Response):
 
     def get_property(self, id: PropertyId) -> Optional[Any]:
         return self._properties.get(id, None)
+
+
+# Map of response IDs to response classes
+_RESPONSE_CLASSES = {
+    ResponseId.STATE: StateResponse,
+    ResponseId.CAPABILITIES: CapabilitiesResponse,
+    ResponseId.PROPERTIES: PropertiesResponse,
+    ResponseId.PROPERTIES_ACK: PropertiesResponse,
+}
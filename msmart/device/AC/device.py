@@ -230,8 +230,9 @@ class AirConditioner(Device):
         if isinstance(response, (StateResponse, PropertiesResponse)):
             self._update_state(response)
         else:
-            _LOGGER.debug("Ignored unknown response from %s:%d: %s",
-                          self.ip, self.port, response.payload.hex())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Ignored unknown response from %s:%d: %s",
+                              self.ip, self.port, response.payload.hex())
 
     async def _send_command_get_responses(self, command) -> List[Response]:
         """Send a command and return all valid responses."""
@@ -268,8 +269,9 @@ class AirConditioner(Device):
             if response.id == response_id:
                 return response
 
-            _LOGGER.debug("Ignored response with ID %d from %s:%d: %s",
-                          response.id, self.ip, self.port, response.payload.hex())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Ignored response with ID %d from %s:%d: %s",
+                              response.id, self.ip, self.port, response.payload.hex())
 
         return None
 
@@ -33,12 +33,12 @@ class _TestResponseBase(unittest.TestCase):
 
 class TestCommand(unittest.TestCase):
 
+    EXPECTED_PAYLOAD = bytes.fromhex(
+        "418100ff03ff00020000000000000000000000000311f4")
+
     def test_frame(self) -> None:
         """Test that we frame a command properly."""
 
-        EXPECTED_PAYLOAD = bytes.fromhex(
-            "418100ff03ff00020000000000000000000000000311f4")
-
         # Override message id to match test data
         Command._message_id = 0x10
 
@@ -52,11 +52,11 @@ class TestCommand(unittest.TestCase):
             Frame.validate(frame_mv)
 
         # Check frame payload to ensure it matches expected
-        self.assertEqual(frame[10:-1], EXPECTED_PAYLOAD)
+        self.assertEqual(frame[10:-1], self.EXPECTED_PAYLOAD)
 
         # Check length byte
         self.assertEqual(frame[1], len(
-            EXPECTED_PAYLOAD) + Frame._HEADER_LENGTH)
+            self.EXPECTED_PAYLOAD) + Frame._HEADER_LENGTH)
 
         # Check device type
         self.assertEqual(frame[2], DeviceType.AIR_CONDITIONER)
@@ -75,17 +75,61 @@ class TestStateResponse(_TestResponseBase):
                       "outdoor_temperature", "filter_alert", "display_on",
                       "freeze_protection_mode"]
 
+    # https://github.com/mill1000/midea-ac-py/issues/11#issuecomment-1650647625
+    # V3 state response with checksum as CRC, and shorter than expected
+    TEST_MESSAGE_CHECKSUM_AS_CRC = bytes.fromhex(
+        "aa1eac00000000000003c0004b1e7f7f000000000069630000000000000d33")
+
+    # V2 state response
+    TEST_MESSAGE_V2 = bytes.fromhex(
+        "aa22ac00000000000303c0014566000000300010045eff00000000000000000069fdb9")
+
+    # V3 state response
+    TEST_MESSAGE_V3 = bytes.fromhex(
+        "aa23ac00000000000303c00145660000003c0010045c6b20000000000000000000020d79")
+
+    # Messages with additional temperature precision bits
+    TEST_PRECISION_MESSAGES = {
+        # https://github.com/mill1000/midea-msmart/issues/89#issuecomment-1783316836
+        (24.0, 25.1, 10.0): bytes.fromhex(
+            "aa23ac00000000000203c00188647f7f000000000063450c0056190000000000000497c3"),
+        # https://github.com/mill1000/midea-msmart/issues/89#issuecomment-1782352164
+        (24.0, 27.0, 10.2): bytes.fromhex(
+            "aa23ac00000000000203c00188647f7f000000000067450c00750000000000000001a3b0"),
+        (24.0, 25.0, 10.0): bytes.fromhex(
+            "aa23ac00000000000203c00188647f7f000080000064450c00501d00000000000001508e"),
+    }
+
+    # Raw responses with additional temperature precision bits
+    TEST_PRECISION_PAYLOADS = {
+        # https://github.com/mill1000/midea-ac-py/issues/39#issuecomment-1729884851
+        # Corrected target values from user reported values
+        (16.0, 23.2, 18.4): bytes.fromhex("c00181667f7f003c00000060560400420000000000000048"),
+        (16.5, 23.4, 18.4): bytes.fromhex("c00191667f7f003c00000060560400440000000000000049"),
+        (17.0, 24.1, 18.3): bytes.fromhex("c00181667f7f003c0000006156050036000000000000004a"),
+        (17.5, 24.3, 18.2): bytes.fromhex("c00191667f7f003c0000006156050028000000000000004b"),
+        (18.0, 24.3, 18.2): bytes.fromhex("c00182667f7f003c0000006156060028000000000000004c"),
+        (18.5, 24.3, 18.2): bytes.fromhex("c00192667f7f003c0000006156060028000000000000004d"),
+        (19.0, 24.3, 18.2): bytes.fromhex("c00183667f7f003c0000006156070028000000000000004e"),
+        (19.5, 24.0, 19.0): bytes.fromhex("c00193667f7f003c00000061570700550000000000000050"),
+    }
+
+    # Raw responses with a variety of target temperatures
+    TEST_TARGET_PAYLOADS = tuple(
+        (targets[0], payload) for targets, payload in TEST_PRECISION_PAYLOADS.items()
+    ) + (
+        # Midea U-Shaped
+        (16.0, bytes.fromhex("c00040660000003c00000062680400000000000000000004")),
+        (16.5, bytes.fromhex("c00050660000003c00000062670400000000000000000004")),
+    )
+
     def _test_response(self, msg) -> StateResponse:
         resp = self._test_build_response(msg)
         self._test_check_attributes(resp, self.EXPECTED_ATTRS)
         return cast(StateResponse, resp)
 
     def test_message_checksum(self) -> None:
-        # https://github.com/mill1000/midea-ac-py/issues/11#issuecomment-1650647625
-        # V3 state response with checksum as CRC, and shorter than expected
-        TEST_MESSAGE_CHECKSUM_AS_CRC = bytes.fromhex(
-            "aa1eac00000000000003c0004b1e7f7f000000000069630000000000000d33")
-        resp = self._test_response(TEST_MESSAGE_CHECKSUM_AS_CRC)
+        resp = self._test_response(self.TEST_MESSAGE_CHECKSUM_AS_CRC)
 
         # Assert response is a state response
         self.assertEqual(type(resp), StateResponse)
@@ -98,10 +142,7 @@ class TestStateResponse(_TestResponseBase):
         self.assertEqual(resp.outdoor_temperature, 24.5)
 
     def test_message_v2(self) -> None:
-        # V2 state response
-        TEST_MESSAGE_V2 = bytes.fromhex(
-            "aa22ac00000000000303c0014566000000300010045eff00000000000000000069fdb9")
-        resp = self._test_response(TEST_MESSAGE_V2)
+        resp = self._test_response(self.TEST_MESSAGE_V2)
 
         # Assert response is a state response
         self.assertEqual(type(resp), StateResponse)
@@ -114,10 +155,7 @@ class TestStateResponse(_TestResponseBase):
         self.assertEqual(resp.outdoor_temperature, None)
 
     def test_message_v3(self) -> None:
-        # V3 state response
-        TEST_MESSAGE_V3 = bytes.fromhex(
-            "aa23ac00000000000303c00145660000003c0010045c6b20000000000000000000020d79")
-        resp = self._test_response(TEST_MESSAGE_V3)
+        resp = self._test_response(self.TEST_MESSAGE_V3)
 
         # Assert response is a state response
         self.assertEqual(type(resp), StateResponse)
@@ -131,103 +169,63 @@ class TestStateResponse(_TestResponseBase):
 
     def test_message_additional_precision(self) -> None:
         """Test decoding of temperatures with higher precision."""
-        # Messages with additional temperature precision bits
-        TEST_MESSAGES = {
-            # https://github.com/mill1000/midea-msmart/issues/89#issuecomment-1783316836
-            (24.0, 25.1, 10.0): bytes.fromhex(
-                "aa23ac00000000000203c00188647f7f000000000063450c0056190000000000000497c3"),
-            # https://github.com/mill1000/midea-msmart/issues/89#issuecomment-1782352164
-            (24.0, 27.0, 10.2): bytes.fromhex(
-                "aa23ac00000000000203c00188647f7f000000000067450c00750000000000000001a3b0"),
-            (24.0, 25.0, 10.0): bytes.fromhex(
-                "aa23ac00000000000203c00188647f7f000080000064450c00501d00000000000001508e"),
-        }
+        for targets, message in self.TEST_PRECISION_MESSAGES.items():
+            with self.subTest(targets=targets):
+                # Create response from the message
+                resp = self._test_response(message)
 
-        for targets, message in TEST_MESSAGES.items():
-            # Create response from the message
-            resp = self._test_response(message)
-
-            # Assert response is a state response
-            self.assertEqual(type(resp), StateResponse)
-
-            # Suppress type errors
-            resp = cast(StateResponse, resp)
-
-            target, indoor, outdoor = targets
-
-            self.assertEqual(resp.target_temperature, target)
-            self.assertEqual(resp.indoor_temperature, indoor)
-            self.assertEqual(resp.outdoor_temperature, outdoor)
-
-        # Raw responses with additional temperature precision bits
-        TEST_RESPONSES = {
-            # https://github.com/mill1000/midea-ac-py/issues/39#issuecomment-1729884851
-            # Corrected target values from user reported values
-            (16.0, 23.2, 18.4): bytes.fromhex("c00181667f7f003c00000060560400420000000000000048"),
-            (16.5, 23.4, 18.4): bytes.fromhex("c00191667f7f003c00000060560400440000000000000049"),
-            (17.0, 24.1, 18.3): bytes.fromhex("c00181667f7f003c0000006156050036000000000000004a"),
-            (17.5, 24.3, 18.2): bytes.fromhex("c00191667f7f003c0000006156050028000000000000004b"),
-            (18.0, 24.3, 18.2): bytes.fromhex("c00182667f7f003c0000006156060028000000000000004c"),
-            (18.5, 24.3, 18.2): bytes.fromhex("c00192667f7f003c0000006156060028000000000000004d"),
-            (19.0, 24.3, 18.2): bytes.fromhex("c00183667f7f003c0000006156070028000000000000004e"),
-            (19.5, 24.0, 19.0): bytes.fromhex("c00193667f7f003c00000061570700550000000000000050"),
-        }
+                # Assert response is a state response
+                self.assertEqual(type(resp), StateResponse)
 
-        for targets, payload in TEST_RESPONSES.items():
-            # Create response
-            with memoryview(payload) as mv_payload:
-                resp = StateResponse(mv_payload)
+                # Suppress type errors
+                resp = cast(StateResponse, resp)
 
-            # Assert that it exists
-            self.assertIsNotNone(resp)
+                target, indoor, outdoor = targets
+
+                self.assertEqual(resp.target_temperature, target)
+                self.assertEqual(resp.indoor_temperature, indoor)
+                self.assertEqual(resp.outdoor_temperature, outdoor)
 
-            # Assert response is a state response
-            self.assertEqual(type(resp), StateResponse)
+        for targets, payload in self.TEST_PRECISION_PAYLOADS.items():
+            with self.subTest(targets=targets):
+                # Create response
+                with memoryview(payload) as mv_payload:
+                    resp = StateResponse(mv_payload)
 
-            # Suppress type errors
-            resp = cast(StateResponse, resp)
+                # Assert that it exists
+                self.assertIsNotNone(resp)
 
-            target, indoor, outdoor = targets
+                # Assert response is a state response
+                self.assertEqual(type(resp), StateResponse)
 
-            self.assertEqual(resp.target_temperature, target)
-            self.assertEqual(resp.indoor_temperature, indoor)
-            self.assertEqual(resp.outdoor_temperature, outdoor)
+                # Suppress type errors
+                resp = cast(StateResponse, resp)
+
+                target, indoor, outdoor = targets
+
+                self.assertEqual(resp.target_temperature, target)
+                self.assertEqual(resp.indoor_temperature, indoor)
+                self.assertEqual(resp.outdoor_temperature, outdoor)
 
     def test_target_temperature(self) -> None:
         """Test decoding of target temperature from a variety of state responses."""
-        TEST_PAYLOADS = {
-            # https://github.com/mill1000/midea-ac-py/issues/39#issuecomment-1729884851
-            # Corrected target values from user reported values
-            16.0: bytes.fromhex("c00181667f7f003c00000060560400420000000000000048"),
-            16.5: bytes.fromhex("c00191667f7f003c00000060560400440000000000000049"),
-            17.0: bytes.fromhex("c00181667f7f003c0000006156050036000000000000004a"),
-            17.5: bytes.fromhex("c00191667f7f003c0000006156050028000000000000004b"),
-            18.0: bytes.fromhex("c00182667f7f003c0000006156060028000000000000004c"),
-            18.5: bytes.fromhex("c00192667f7f003c0000006156060028000000000000004d"),
-            19.0: bytes.fromhex("c00183667f7f003c0000006156070028000000000000004e"),
-            19.5: bytes.fromhex("c00193667f7f003c00000061570700550000000000000050"),
-
-            # Midea U-Shaped
-            16.0: bytes.fromhex("c00040660000003c00000062680400000000000000000004"),
-            16.5: bytes.fromhex("c00050660000003c00000062670400000000000000000004"),
-        }
+        for target, payload in self.TEST_TARGET_PAYLOADS:
+            with self.subTest(target=target):
+                # Create response
+                with memoryview(payload) as mv_payload:
+                    resp = StateResponse(mv_payload)
 
-        for target, payload in TEST_PAYLOADS.items():
-            # Create response
-            with memoryview(payload) as mv_payload:
-                resp = StateResponse(mv_payload)
+                # Assert that it exists
+                self.assertIsNotNone(resp)
 
-            # Assert that it exists
-            self.assertIsNotNone(resp)
-
-            # Assert response is a state response
-            self.assertEqual(type(resp), StateResponse)
+                # Assert response is a state response
+                self.assertEqual(type(resp), StateResponse)
 
-            # Suppress type errors
-            resp = cast(StateResponse, resp)
+                # Suppress type errors
+                resp = cast(StateResponse, resp)
 
-            # Assert that expected target temperature matches
-            self.assertEqual(resp.target_temperature, target)
+                # Assert that expected target temperature matches
+                self.assertEqual(resp.target_temperature, target)
 
 
 class TestCapabilitiesResponse(_TestResponseBase):
@@ -241,6 +239,31 @@ class TestCapabilitiesResponse(_TestResponseBase):
                            "min_temperature", "max_temperature",
                            "display_control", "filter_reminder"]
 
+    # https://github.com/mill1000/midea-ac-py/issues/13#issuecomment-1657485359
+    # Identical payload received in https://github.com/mill1000/midea-msmart/issues/88#issuecomment-1781972832
+    TEST_CAPABILITIES_RESPONSE = bytes.fromhex(
+        "aa29ac00000000000303b5071202010113020101140201011502010116020101170201001a020101dedb")
+
+    # https://github.com/mac-zhou/midea-ac-py/pull/177#issuecomment-1259772244
+    TEST_CAPABILITIES_RESPONSE_2 = bytes.fromhex(
+        "aa3dac00000000000203b50a12020101180001001402010115020101160201001a020101100201011f020100250207203c203c203c00400001000100c83a")
+
+    # Toshiba Smart Window Unit (2019)
+    TEST_CAPABILITIES_RESPONSE_3 = bytes.fromhex(
+        "aa29ac00000000000303b507120201021402010015020102170201021a0201021002010524020101990d")
+
+    # Midea U-shaped Window Unit (2022)
+    TEST_CAPABILITIES_RESPONSE_4 = bytes.fromhex(
+        "aa39ac00000000000303b50912020102130201001402010015020100170201021a02010010020101250207203c203c203c00240201010102a1a0")
+
+    # https://github.com/mill1000/midea-ac-py/issues/60#issuecomment-1867498321
+    TEST_CAPABILITIES_RESPONSE_5 = bytes.fromhex(
+        "aa3dac00000000000303b50a12020101430001011402010115020101160201001a020101100201011f020103250207203c203c203c05400001000100c805")
+
+    # Additional capabilities response
+    TEST_ADDITIONAL_CAPABILITIES_RESPONSE = bytes.fromhex(
+        "aa23ac00000000000303b5051e020101130201012202010019020100390001010000febe")
+
     def test_properties(self) -> None:
         """Test that the capabilities response has the expected properties."""
 
@@ -305,12 +328,7 @@ class TestCapabilitiesResponse(_TestResponseBase):
 
     def test_capabilities(self) -> None:
         """Test that we decode capabilities responses as expected."""
-        # https://github.com/mill1000/midea-ac-py/issues/13#issuecomment-1657485359
-        # Identical payload received in https://github.com/mill1000/midea-msmart/issues/88#issuecomment-1781972832
-
-        TEST_CAPABILITIES_RESPONSE = bytes.fromhex(
-            "aa29ac00000000000303b5071202010113020101140201011502010116020101170201001a020101dedb")
-        resp = self._test_build_response(TEST_CAPABILITIES_RESPONSE)
+        resp = self._test_build_response(self.TEST_CAPABILITIES_RESPONSE)
         resp = cast(CapabilitiesResponse, resp)
 
         EXPECTED_RAW_CAPABILITIES = {
@@ -345,13 +363,10 @@ class TestCapabilitiesResponse(_TestResponseBase):
 
     def test_capabilities_2(self) -> None:
         """Test that we decode capabilities responses as expected."""
-        # https://github.com/mac-zhou/midea-ac-py/pull/177#issuecomment-1259772244
-        TEST_CAPABILITIES_RESPONSE = bytes.fromhex(
-            "aa3dac00000000000203b50a12020101180001001402010115020101160201001a020101100201011f020100250207203c203c203c00400001000100c83a")
 
         # Test case includes an unknown capability 0x40 that generates a warning
         with self.assertLogs("msmart") as log:
-            resp = self._test_build_response(TEST_CAPABILITIES_RESPONSE)
+            resp = self._test_build_response(self.TEST_CAPABILITIES_RESPONSE_2)
             resp = cast(CapabilitiesResponse, resp)
 
             # Check warning is generated for ID 0x0040
@@ -393,10 +408,7 @@ class TestCapabilitiesResponse(_TestResponseBase):
 
     def test_capabilities_3(self) -> None:
         """Test that we decode capabilities responses as expected."""
-        # Toshiba Smart Window Unit (2019)
-        TEST_CAPABILITIES_RESPONSE = bytes.fromhex(
-            "aa29ac00000000000303b507120201021402010015020102170201021a0201021002010524020101990d")
-        resp = self._test_build_response(TEST_CAPABILITIES_RESPONSE)
+        resp = self._test_build_response(self.TEST_CAPABILITIES_RESPONSE_3)
         resp = cast(CapabilitiesResponse, resp)
 
         EXPECTED_RAW_CAPABILITIES = {
@@ -431,10 +443,7 @@ class TestCapabilitiesResponse(_TestResponseBase):
 
     def test_capabilities_4(self) -> None:
         """Test that we decode capabilities responses as expected."""
-        # Midea U-shaped Window Unit (2022)
-        TEST_CAPABILITIES_RESPONSE = bytes.fromhex(
-            "aa39ac00000000000303b50912020102130201001402010015020100170201021a02010010020101250207203c203c203c00240201010102a1a0")
-        resp = self._test_build_response(TEST_CAPABILITIES_RESPONSE)
+        resp = self._test_build_response(self.TEST_CAPABILITIES_RESPONSE_4)
         resp = cast(CapabilitiesResponse, resp)
 
         EXPECTED_RAW_CAPABILITIES = {
@@ -472,13 +481,10 @@ class TestCapabilitiesResponse(_TestResponseBase):
     def test_additional_capabilities(self) -> None:
         self.maxDiff = None
         """Test that we decode capabilities and additional capabilities responses as expected."""
-        # https://github.com/mill1000/midea-ac-py/issues/60#issuecomment-1867498321
-        TEST_CAPABILITIES_RESPONSE = bytes.fromhex(
-            "aa3dac00000000000303b50a12020101430001011402010115020101160201001a020101100201011f020103250207203c203c203c05400001000100c805")
 
         # Test case includes an unknown capability 0x40 that generates a warning
         with self.assertLogs("msmart") as log:
-            resp = self._test_build_response(TEST_CAPABILITIES_RESPONSE)
+            resp = self._test_build_response(self.TEST_CAPABILITIES_RESPONSE_5)
             resp = cast(CapabilitiesResponse, resp)
 
             # Check warning is generated for ID 0x0040
@@ -504,11 +510,8 @@ class TestCapabilitiesResponse(_TestResponseBase):
         # Check if there are additional capabilities
         self.assertEqual(resp.additional_capabilities, True)
 
-        # Additional capabilities response
-        TEST_ADDITIONAL_CAPABILITIES_RESPONSE = bytes.fromhex(
-            "aa23ac00000000000303b5051e020101130201012202010019020100390001010000febe")
         additional_resp = self._test_build_response(
-            TEST_ADDITIONAL_CAPABILITIES_RESPONSE)
+            self.TEST_ADDITIONAL_CAPABILITIES_RESPONSE)
         additional_resp = cast(CapabilitiesResponse, additional_resp)
 
         EXPECTED_ADDITIONAL_RAW_CAPABILITIES = {
@@ -620,13 +623,26 @@ class TestSetPropertiesCommand(unittest.TestCase):
 class TestPropertiesResponse(_TestResponseBase):
     """Test properties response messages."""
 
+    # https://github.com/mill1000/midea-ac-py/issues/60#issuecomment-1936976587
+    TEST_PROPERTIES_RESPONSE = bytes.fromhex(
+        "aa21ac00000000000303b10409000001000a00000100150000012b1e020000005fa3")
+
+    # https://github.com/mill1000/midea-msmart/issues/97#issuecomment-1949495900
+    TEST_PROPERTIES_ACK_RESPONSE = bytes.fromhex(
+        "aa18ac00000000000302b0020a0000013209001101000089a4")
+
+    # https://github.com/mill1000/midea-msmart/issues/122
+    TEST_PROPERTIES_NOTIFY_RESPONSE = bytes.fromhex(
+        "aa1aac00000000000205b50310060101090001010a000101dcbcb4")
+
+    # https://github.com/mill1000/midea-ac-py/issues/128#issuecomment-2098342003
+    TEST_PROPERTIES_UNKNOWN_RESPONSE = bytes.fromhex(
+        "aa1bac00000000000202b0021e001004001000001a00000100000e18")
+
     def test_properties_parsing(self) -> None:
         """Test we decode properties correctly."""
-        # https://github.com/mill1000/midea-ac-py/issues/60#issuecomment-1936976587
-        TEST_RESPONSE = bytes.fromhex(
-            "aa21ac00000000000303b10409000001000a00000100150000012b1e020000005fa3")
 
-        resp = self._test_build_response(TEST_RESPONSE)
+        resp = self._test_build_response(self.TEST_PROPERTIES_RESPONSE)
 
         # Assert response is a correct type
         self.assertEqual(type(resp), PropertiesResponse)
@@ -647,11 +663,8 @@ class TestPropertiesResponse(_TestResponseBase):
 
     def test_properties_ack(self) -> None:
         """Test we decode an acknowledgement from a set properties command correctly."""
-        # https://github.com/mill1000/midea-msmart/issues/97#issuecomment-1949495900
-        TEST_RESPONSE = bytes.fromhex(
-            "aa18ac00000000000302b0020a0000013209001101000089a4")
 
-        resp = self._test_build_response(TEST_RESPONSE)
+        resp = self._test_build_response(self.TEST_PROPERTIES_ACK_RESPONSE)
         resp = cast(PropertiesResponse, resp)
 
         # Assert response is a correct type
@@ -670,23 +683,18 @@ class TestPropertiesResponse(_TestResponseBase):
 
     def test_properties_notify(self) -> None:
         """Test we ignore property notifications."""
-        # https://github.com/mill1000/midea-msmart/issues/122
-        TEST_RESPONSE = bytes.fromhex(
-            "aa1aac00000000000205b50310060101090001010a000101dcbcb4")
 
-        resp = self._test_build_response(TEST_RESPONSE)
+        resp = self._test_build_response(self.TEST_PROPERTIES_NOTIFY_RESPONSE)
 
         # Assert response is generic
         self.assertEqual(type(resp), Response)
 
     def test_properties_unknown_and_invalid(self) -> None:
         """Test we warn when decoding unknown properties and that invalid properties are not stored."""
-        # https://github.com/mill1000/midea-ac-py/issues/128#issuecomment-2098342003
-        TEST_RESPONSE = bytes.fromhex(
-            "aa1bac00000000000202b0021e001004001000001a00000100000e18")
 
         with self.assertLogs("msmart", logging.WARNING) as log:
-            resp = self._test_build_response(TEST_RESPONSE)
+            resp = self._test_build_response(
+                self.TEST_PROPERTIES_UNKNOWN_RESPONSE)
             resp = cast(PropertiesResponse, resp)
 
             # Check warning is generated for ID 0x001E
@@ -702,30 +710,33 @@ class TestPropertiesResponse(_TestResponseBase):
 class TestResponseConstruct(_TestResponseBase):
     """Test construction of responses from raw data."""
 
+    TEST_RESPONSE_BAD_CHECKSUM = bytes.fromhex(
+        "aa14ac00000000000303b10109000001003c0000FF")
+
+    # PropertiesResponse with invalid CRC
+    # https://github.com/mill1000/midea-ac-py/issues/101#issuecomment-1994824924
+    TEST_RESPONSE_PROPERTIES_BAD_CRC = bytes.fromhex(
+        "aa14ac00000000000303b10109000001003c000042")
+
+    # Mocked up StateResponse with invalid CRC
+    TEST_RESPONSE_STATE_BAD_CRC = bytes.fromhex(
+        "aa22ac00000000000303c0014566000000300010045eff00000000000000000069aa0c")
+
     def test_invalid_checksum(self) -> None:
         """Test that invalid checksums raise exceptions."""
-        TEST_RESPONSE_BAD_CHECKSUM = bytes.fromhex(
-            "aa14ac00000000000303b10109000001003c0000FF")
 
         with self.assertRaises(InvalidFrameException):
-            Response.construct(TEST_RESPONSE_BAD_CHECKSUM)
+            Response.construct(self.TEST_RESPONSE_BAD_CHECKSUM)
 
     def test_properties_response_invalid_crc(self) -> None:
         """Test that PropertiesResponses with invalid CRCs are accepted."""
-        # PropertiesResponse with invalid CRC
-        # https://github.com/mill1000/midea-ac-py/issues/101#issuecomment-1994824924
-        TEST_RESPONSE_PROPERTIES_BAD_CRC = bytes.fromhex(
-            "aa14ac00000000000303b10109000001003c000042")
-        # Mocked up StateResponse with invalid CRC
-        TEST_RESPONSE_STATE_BAD_CRC = bytes.fromhex(
-            "aa22ac00000000000303c0014566000000300010045eff00000000000000000069aa0c")
 
         # Assert that constructing a StateResponse with invalid CRC raises an exception
         with self.assertRaises(InvalidResponseException):
-            resp = Response.construct(TEST_RESPONSE_STATE_BAD_CRC)
+            resp = Response.construct(self.TEST_RESPONSE_STATE_BAD_CRC)
 
         # Now construct a PropertiesResponse with an invalid CRC
-        resp = Response.construct(TEST_RESPONSE_PROPERTIES_BAD_CRC)
+        resp = Response.construct(self.TEST_RESPONSE_PROPERTIES_BAD_CRC)
 
         self.assertIsNotNone(resp)
         self.assertEqual(type(resp), PropertiesResponse)
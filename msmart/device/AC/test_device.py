@@ -103,117 +103,116 @@ class TestDeviceEnums(unittest.TestCase):
 class TestUpdateStateFromResponse(unittest.TestCase):
     """Test updating device state from responses."""
 
+    # V3 state response
+    TEST_STATE_RESPONSE = bytes.fromhex(
+        "aa23ac00000000000303c00145660000003c0010045c6b20000000000000000000020d79")
+
+    # https://github.com/mill1000/midea-ac-py/issues/60#issuecomment-1936976587
+    TEST_PROPERTIES_RESPONSE = bytes.fromhex(
+        "aa21ac00000000000303b10409000001000a00000100150000012b1e020000005fa3")
+
+    # https://github.com/mill1000/midea-msmart/issues/97#issuecomment-1949495900
+    TEST_PROPERTIES_ACK_RESPONSE = bytes.fromhex(
+        "aa18ac00000000000302b0020a0000013209001101000089a4")
+
+    # https://github.com/mill1000/midea-msmart/issues/97#issuecomment-1949495900
+    TEST_PROPERTIES_PARTIAL_RESPONSE = bytes.fromhex(
+        "aa13ac00000000000303b1010a0000013200c884")
+
+    def setUp(self) -> None:
+        # Create a dummy device
+        self.device = AC(0, 0, 0)
+
     def test_state_response(self) -> None:
         """Test parsing of StateResponses into device state."""
 
-        # V3 state response
-        TEST_RESPONSE = bytes.fromhex(
-            "aa23ac00000000000303c00145660000003c0010045c6b20000000000000000000020d79")
-
-        resp = Response.construct(TEST_RESPONSE)
+        resp = Response.construct(self.TEST_STATE_RESPONSE)
         self.assertIsNotNone(resp)
 
         # Assert response is a state response
         self.assertEqual(type(resp), StateResponse)
 
-        # Create a dummy device and process the response
-        device = AC(0, 0, 0)
-        device._process_state_response(resp)
+        # Process the response
+        self.device._process_state_response(resp)
 
         # Assert state is expected
-        self.assertEqual(device.target_temperature, 21.0)
-        self.assertEqual(device.indoor_temperature, 21.0)
-        self.assertEqual(device.outdoor_temperature, 28.5)
+        self.assertEqual(self.device.target_temperature, 21.0)
+        self.assertEqual(self.device.indoor_temperature, 21.0)
+        self.assertEqual(self.device.outdoor_temperature, 28.5)
 
-        self.assertEqual(device.eco_mode, True)
-        self.assertEqual(device.turbo_mode, False)
-        self.assertEqual(device.freeze_protection_mode, False)
-        self.assertEqual(device.sleep_mode, False)
+        self.assertEqual(self.device.eco_mode, True)
+        self.assertEqual(self.device.turbo_mode, False)
+        self.assertEqual(self.device.freeze_protection_mode, False)
+        self.assertEqual(self.device.sleep_mode, False)
 
-        self.assertEqual(device.operational_mode, AC.OperationalMode.COOL)
-        self.assertEqual(device.fan_speed, AC.FanSpeed.AUTO)
-        self.assertEqual(device.swing_mode, AC.SwingMode.VERTICAL)
+        self.assertEqual(self.device.operational_mode, AC.OperationalMode.COOL)
+        self.assertEqual(self.device.fan_speed, AC.FanSpeed.AUTO)
+        self.assertEqual(self.device.swing_mode, AC.SwingMode.VERTICAL)
 
     def test_properties_response(self) -> None:
         """Test parsing of PropertiesResponse into device state."""
-        # https://github.com/mill1000/midea-ac-py/issues/60#issuecomment-1936976587
-        TEST_RESPONSE = bytes.fromhex(
-            "aa21ac00000000000303b10409000001000a00000100150000012b1e020000005fa3")
-
-        # Create a dummy device
-        device = AC(0, 0, 0)
 
         # Set some properties
-        device.horizontal_swing_angle = AC.SwingAngle.POS_5
-        device.vertical_swing_angle = AC.SwingAngle.POS_5
+        self.device.horizontal_swing_angle = AC.SwingAngle.POS_5
+        self.device.vertical_swing_angle = AC.SwingAngle.POS_5
 
-        resp = Response.construct(TEST_RESPONSE)
+        resp = Response.construct(self.TEST_PROPERTIES_RESPONSE)
         self.assertIsNotNone(resp)
 
         # Assert response is a state response
         self.assertEqual(type(resp), PropertiesResponse)
 
         # Process the response
-        device._process_state_response(resp)
+        self.device._process_state_response(resp)
 
         # Assert state is expected
-        self.assertEqual(device.horizontal_swing_angle, AC.SwingAngle.OFF)
-        self.assertEqual(device.vertical_swing_angle, AC.SwingAngle.OFF)
+        self.assertEqual(self.device.horizontal_swing_angle, AC.SwingAngle.OFF)
+        self.assertEqual(self.device.vertical_swing_angle, AC.SwingAngle.OFF)
 
     def test_properties_ack_response(self) -> None:
         """Test parsing of PropertiesResponse from SetProperties command into device state."""
-        # https://github.com/mill1000/midea-msmart/issues/97#issuecomment-1949495900
-        TEST_RESPONSE = bytes.fromhex(
-            "aa18ac00000000000302b0020a0000013209001101000089a4")
-
-        # Create a dummy device
-        device = AC(0, 0, 0)
 
         # Set some properties
-        device.horizontal_swing_angle = AC.SwingAngle.OFF
-        device.vertical_swing_angle = AC.SwingAngle.OFF
+        self.device.horizontal_swing_angle = AC.SwingAngle.OFF
+        self.device.vertical_swing_angle = AC.SwingAngle.OFF
 
-        resp = Response.construct(TEST_RESPONSE)
+        resp = Response.construct(self.TEST_PROPERTIES_ACK_RESPONSE)
         self.assertIsNotNone(resp)
 
         # Assert response is a state response
         self.assertEqual(type(resp), PropertiesResponse)
 
         # Process the response
-        device._process_state_response(resp)
+        self.device._process_state_response(resp)
 
         # Assert state is expected
-        self.assertEqual(device.horizontal_swing_angle, AC.SwingAngle.POS_3)
-        self.assertEqual(device.vertical_swing_angle, AC.SwingAngle.OFF)
+        self.assertEqual(self.device.horizontal_swing_angle,
+                         AC.SwingAngle.POS_3)
+        self.assertEqual(self.device.vertical_swing_angle, AC.SwingAngle.OFF)
 
     def test_properties_missing_field(self) -> None:
         """Test parsing of PropertiesResponse that only contains some properties."""
-        # https://github.com/mill1000/midea-msmart/issues/97#issuecomment-1949495900
-        TEST_RESPONSE = bytes.fromhex(
-            "aa13ac00000000000303b1010a0000013200c884")
-
-        # Create a dummy device
-        device = AC(0, 0, 0)
 
         # Set some properties
-        device.horizontal_swing_angle = AC.SwingAngle.POS_5
-        device.vertical_swing_angle = AC.SwingAngle.POS_5
+        self.device.horizontal_swing_angle = AC.SwingAngle.POS_5
+        self.device.vertical_swing_angle = AC.SwingAngle.POS_5
 
         # Construct and assert response
-        resp = Response.construct(TEST_RESPONSE)
+        resp = Response.construct(self.TEST_PROPERTIES_PARTIAL_RESPONSE)
         self.assertIsNotNone(resp)
 
         # Assert response is a state response
         self.assertEqual(type(resp), PropertiesResponse)
 
         # Process response
-        device._process_state_response(resp)
+        self.device._process_state_response(resp)
 
         # Assert that only the properties in the response are updated
-        self.assertEqual(device.horizontal_swing_angle, AC.SwingAngle.POS_3)
+        self.assertEqual(self.device.horizontal_swing_angle,
+                         AC.SwingAngle.POS_3)
 
         # Assert other properties are untouched
-        self.assertEqual(device.vertical_swing_angle, AC.SwingAngle.POS_5)
+        self.assertEqual(self.device.vertical_swing_angle, AC.SwingAngle.POS_5)
 
 
 if __name__ == "__main__":
@@ -12,40 +12,42 @@ class Frame():
     _HEADER_LENGTH = 10
 
     def __init__(self, device_type: DeviceType, frame_type: FrameType) -> None:
-        self._device_type = device_type
-        self._frame_type = frame_type
-        self._protocol_version = 0
-
-    def tobytes(self, data: Union[bytes, bytearray] = bytes()) -> bytes:
-        # Build frame header
+        # Build header template of fields that are fixed for this frame
         header = bytearray(self._HEADER_LENGTH)
 
         # Start byte
         header[0] = 0xAA
 
-        # Length of header and data
-        header[1] = len(data) + self._HEADER_LENGTH
-
         # Device/appliance type
-        header[2] = self._device_type
+        header[2] = device_type
 
         # Device protocol version
-        header[8] = self._protocol_version
+        header[8] = 0
 
         # Frame type
-        header[9] = self._frame_type
+        header[9] = frame_type
+
+        self._header = bytes(header)
+
+    def tobytes(self, data: Union[bytes, bytearray] = bytes()) -> bytes:
+        # Length of header and data
+        length = len(data) + self._HEADER_LENGTH
 
-        # Build frame from header and data
-        frame = bytearray(header + data)
+        # Allocate frame with room for the checksum and fill it in place
+        frame = bytearray(length + 1)
+        frame[:self._HEADER_LENGTH] = self._header
+        frame[self._HEADER_LENGTH:length] = data
+        frame[1] = length
 
         # Calculate total frame checksum
-        frame.append(Frame.checksum(frame[1:]))
+        frame[-1] = Frame.checksum(frame[1:-1])
 
         return bytes(frame)
 
     @classmethod
     def checksum(cls, frame: bytes) -> int:
-        return (~sum(frame) + 1) & 0xFF
+        # Two's complement of the byte sum, i.e. -sum mod 256
+        return -sum(frame) & 0xFF
 
     @classmethod
     def validate(cls, frame: memoryview) -> None:
@@ -85,7 +85,8 @@ class _LanProtocol(asyncio.Protocol):
     def data_received(self, data: bytes) -> None:
         """Handle data received events."""
 
-        _LOGGER.debug("Received data from %s: %s", self.peer, data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received data from %s: %s", self.peer, data.hex())
         self._queue.put_nowait(data)
 
     def connection_lost(self, exc) -> None:
@@ -110,7 +111,8 @@ class _LanProtocol(asyncio.Protocol):
         if not self.alive:
             raise ProtocolError("Transport is closing or closed.")
 
-        _LOGGER.debug("Sending data to %s: %s", self.peer, data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending data to %s: %s", self.peer, data.hex())
         self._transport.write(data)
 
     async def _read_queue(self, timeout: int = 2) -> bytes:
@@ -191,7 +193,8 @@ class _LanProtocolV3(_LanProtocol):
     def data_received(self, data: bytes) -> None:
         """Handle data received events."""
 
-        _LOGGER.debug("Received data from %s: %s", self.peer, data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received data from %s: %s", self.peer, data.hex())
 
         # Add incoming data to buffer
         self._buffer += data
@@ -551,13 +554,15 @@ class LAN:
 
         # Await a response
         packet = await self._protocol.read(**kwargs)
-        _LOGGER.debug("Received packet from %s: %s",
-                      self._protocol.peer, packet.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received packet from %s: %s",
+                          self._protocol.peer, packet.hex())
 
         # Decode packet to frame
         response = _Packet.decode(packet)
-        _LOGGER.debug("Received response from %s: %s",
-                      self._protocol.peer, response.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received response from %s: %s",
+                          self._protocol.peer, response.hex())
 
         return response
 
@@ -601,8 +606,9 @@ class LAN:
         # Send the request and wait for a response
         while retries > 0:
             # Send the request
-            _LOGGER.debug("Sending packet to %s: %s",
-                          self._protocol.peer, packet.hex())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Sending packet to %s: %s",
+                              self._protocol.peer, packet.hex())
             self._protocol.write(packet)
 
             try:
@@ -17,20 +17,24 @@ class MideaIntEnum(IntEnum):
 
     @classmethod
     def get_from_value(cls, value: Optional[int], default: Optional[MideaIntEnum] = None) -> MideaIntEnum:
-        try:
-            return cls(cast(int, value))
-        except ValueError:
-            _LOGGER.debug("Unknown %s: %s", cls, value)
-            if default is None:
-                default = cls.DEFAULT  # pyright: ignore[reportAttributeAccessIssue] # nopep8
-            return cls(default)
+        # Look up member directly to avoid the exception path of cls(value)
+        member = cls._value2member_map_.get(value)
+        if member is not None:
+            return cast(MideaIntEnum, member)
+
+        _LOGGER.debug("Unknown %s: %s", cls, value)
+        if default is None:
+            return cls.DEFAULT  # pyright: ignore[reportAttributeAccessIssue] # nopep8
+        return cls(default)
 
     @classmethod
     def get_from_name(cls, name: Optional[str], default: Optional[MideaIntEnum] = None) -> MideaIntEnum:
-        try:
-            return cls[cast(str, name)]
-        except KeyError:
-            _LOGGER.debug("Unknown %s: %s", cls, name)
-            if default is None:
-                default = cls.DEFAULT  # pyright: ignore[reportAttributeAccessIssue] # nopep8
-            return cls(default)
+        # Look up member directly to avoid the exception path of cls[name]
+        member = cls._member_map_.get(cast(str, name))
+        if member is not None:
+            return cast(MideaIntEnum, member)
+
+        _LOGGER.debug("Unknown %s: %s", cls, name)
+        if default is None:
+            return cls.DEFAULT  # pyright: ignore[reportAttributeAccessIssue] # nopep8
+        return cls(default)